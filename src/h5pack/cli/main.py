@@ -65,6 +65,12 @@ def get_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="skip validating files before generating the partition(s)"
     )
+    pack_parser.add_argument(
+        "--metadata-cache",
+        type=str,
+        metavar="FILE",
+        help=".parquet file caching audio metadata between validations"
+    )
     pack_parser.add_argument(
         "--skip-checksum",
         action="store_true",
@@ -81,6 +87,13 @@ def get_parser() -> argparse.ArgumentParser:
         default=1,
         help="number of workers (0 means 1 worker per core)"
     )
+    pack_parser.add_argument(
+        "--compression",
+        type=str,
+        choices=["none", "lzf", "gzip"],
+        default="none",
+        help="compression of fixed length audio data"
+    )
     pack_parser.add_argument(
         "-u", "--unattended",
         action="store_true",
@@ -104,6 +117,19 @@ def get_parser() -> argparse.ArgumentParser:
         type=str,
         help="output folder"
     )
+    unpack_parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="number of workers (0 means 1 worker per core)"
+    )
+    unpack_parser.add_argument(
+        "-f", "--format",
+        type=str,
+        choices=["csv", "parquet"],
+        default="csv",
+        help="format of the output annotations file"
+    )
 
     # Virtual parser
     virtual_parser = subparser.add_parser(
@@ -3,11 +3,13 @@ import math
 import polars as pl
 from argparse import Namespace
 from datetime import datetime
+from functools import partial
 from threading import Thread
 from time import perf_counter
 from multiprocessing import (
     Pool,
-    Manager
+    Queue as ProcessQueue,
+    TimeoutError as PoolTimeoutError
 )
 from importlib.metadata import version
 from rich.progress import (
@@ -16,7 +18,10 @@ from rich.progress import (
     TextColumn,
     TimeRemainingColumn
 )
-from queue import Empty
+from queue import (
+    Empty,
+    Queue
+)
 from ..core.io import (
     add_extension,
     add_suffix,
@@ -37,7 +42,9 @@ from ..data.validators import validate_config_file
 from ..data import get_validators_map
 from .utils import (
     create_partition_from_data,
-    create_virtual_dataset_from_partitions
+    create_partitions_from_data,
+    create_virtual_dataset_from_partitions,
+    init_partition_worker
 )
 
 
@@ -61,7 +68,8 @@ def cmd_pack(args: Namespace) -> None:
     
     # Infer root based on input .yaml file and add to parsing context
     ctx = {
-        "root_dir": os.path.dirname(os.path.abspath(args.config))
+        "root_dir": os.path.dirname(os.path.abspath(args.config)),
+        "metadata_cache": args.metadata_cache
     }
 
 
@@ -92,10 +100,13 @@ def cmd_pack(args: Namespace) -> None:
         config["datasets"][args.dataset]["data"]["file"]
     )
 
-    if not is_file_with_ext(data_file, ".csv"):
+    if not is_file_with_ext(data_file, [".csv", ".parquet"]):
         exit_error(f"Invalid data file '{data_file}'")
 
-    data_df = pl.read_csv(data_file, has_header=True)
+    data_df = (
+        pl.read_parquet(data_file) if data_file.endswith(".parquet")
+        else pl.read_csv(data_file, has_header=True)
+    )
     specs = config["datasets"][args.dataset]["data"]
 
     # Validate data fields
@@ -200,10 +211,8 @@ def cmd_pack(args: Namespace) -> None:
     specs["attrs"].update(config["datasets"][args.dataset]["attrs"])
 
     # Generate partitions
-    manager = Manager()
-    queue = manager.Queue()
-    ctx["queue"] = queue
     ctx["num_partitions"] = num_partitions  # Used in workers
+    ctx["compression"] = args.compression
 
     # Add progress bar per field
     progress_bar = Progress(
@@ -255,6 +264,10 @@ def cmd_pack(args: Namespace) -> None:
         start_time = perf_counter() 
 
         if args.workers == 1:  # Sequential
+            # Partitions are created by a thread in this same process
+            queue = Queue()
+            ctx["queue"] = queue
+
             for partition_idx in range(num_partitions):
                 container = {}
 
@@ -293,32 +306,59 @@ def cmd_pack(args: Namespace) -> None:
                 partition_filenames.append(filename)
                 print(f"Partition #{partition_idx} saved to '{filename}'")
         
-        else:  # Recurrent
+        else:  # Recurrent
+            # Each worker receives a batch of partitions per task, so the
+            # input data is pickled once per batch instead of once per
+            # partition
+            queue = ProcessQueue()
+            pool = Pool(
+                processes=args.workers,
+                initializer=init_partition_worker,
+                initargs=(queue,)
+            )
+            batch_len = max(1, num_partitions // (4 * args.workers))
+
+            # NOTE: Batches are built here since `imap_unordered()` only
+            # returns an iterator with a timeout for `chunksize=1`
+            jobs = pool.imap_unordered(
+                partial(
+                    create_partitions_from_data,
+                    specs=specs,
+                    data=data_df,
+                    args=args,
+                    ctx=ctx
+                ),
+                [
+                    list(range(idx, min(idx + batch_len, num_partitions)))
+                    for idx in range(0, num_partitions, batch_len)
+                ]
+            )
+
             finished_jobs = set()
-            pool = Pool(processes=args.workers)
-            jobs = [
-                pool.apply_async(
-                    func=create_partition_from_data,
-                    args=(partition_idx, specs, data_df, args, ctx)
-                )
-                for partition_idx in range(num_partitions)
-            ]
 
             while len(finished_jobs) < num_partitions:
                 try:
                     partition_idx, step = queue.get(timeout=0.1)
-                    progress_bar.update(
-                        task_ids[f"{partition_idx}_{field_name}"],
-                        advance=step
-                    )
+
+                    # NOTE: Progress may arrive after the partition finished
+                    if partition_idx not in finished_jobs:
+                        progress_bar.update(
+                            task_ids[f"{partition_idx}_{field_name}"],
+                            advance=step
+                        )
                 
                 except Empty:
                     pass
             
-                for job_idx, job in enumerate(jobs):
-                    if job.ready() and job_idx not in finished_jobs:
-                        finished_jobs.add(job_idx)
-                        partition_idx, filename = job.get()
+                while True:
+                    try:
+                        batch_results = jobs.next(timeout=0)
+                    
+                    except (PoolTimeoutError, StopIteration):
+                        break
+
+                    for partition_idx, filename in batch_results:
+                        finished_jobs.add(partition_idx)
 
                         for task_id in task_ids:
                             # Remove all partition tasks
@@ -327,12 +367,17 @@ def cmd_pack(args: Namespace) -> None:
 
                         partition_filenames.append(filename)
                         print(
-                            f"Partition #{partition_idx} saved to '{filename}'"
+                            f"Partition #{partition_idx} saved to "
+                            f"'{filename}'"
                         )
                     
             pool.close()
             pool.join()
 
+            # Partitions finish in any order but are stacked by index later
+            # on (suffixes are zero-padded, so sorting by name is enough)
+            partition_filenames.sort()
+
     print("\033[F\033[K", end="")  # Clear blank line from Rich
 
     # --------------------------------------------------------------------------
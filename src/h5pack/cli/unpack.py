@@ -1,6 +1,7 @@
 import os
 import yaml
 import h5py
+import polars as pl
 from packaging import version
 from argparse import Namespace
 from time import perf_counter
@@ -22,6 +23,10 @@ def cmd_unpack(args: Namespace) -> None:
     Args:
         args (Namespace): User input arguments provided through the console.
     """
+    # Assign workers equal to cpu cores if value is 0
+    if args.workers == 0:
+        args.workers = os.cpu_count()
+
     # Check if file exists
     if not is_file_with_ext(args.input, ext=".h5"):
         exit_error(f"Invalid input fille '{args.input}'")
@@ -51,12 +56,21 @@ def cmd_unpack(args: Namespace) -> None:
         "datasets": {
             dataset_name: {
                 "attrs": {},
-                "data": {"file": "dataset.csv", "fields": {}}  # Fixed name
+                "data": {
+                    "file": f"dataset.{args.format}",  # Fixed name
+                    "fields": {}
+                }
             }
         }
     }
 
-    with h5py.File(args.input, mode="r") as h5_file:
+    # Chunk cache large enough to hold all chunks of a block of rows read by
+    # the extractors
+    with h5py.File(
+        args.input,
+        mode="r",
+        rdcc_nbytes=64 * 1024 * 1024
+    ) as h5_file:
         # Extract attributes
         print("Extracting file attribute(s) ...")
         
@@ -70,9 +84,8 @@ def cmd_unpack(args: Namespace) -> None:
         # Extract data
         os.makedirs(os.path.join(args.output, "data"), exist_ok=True)
 
-        # Creat empty dataset.csv
-        dataset = os.path.join(args.output, "dataset.csv")
-        open(dataset, "w").close()
+        # Annotations file is written once all fields are extracted
+        dataset = os.path.join(args.output, f"dataset.{args.format}")
 
         progress_bar = Progress(
             TextColumn("{task.description}"),
@@ -87,12 +100,17 @@ def cmd_unpack(args: Namespace) -> None:
             "producer_version": version.parse(
                 h5_file.attrs["producer"].replace("h5pack ", "")
             ),
-            "progress_bar": progress_bar
+            "progress_bar": progress_bar,
+            "workers": args.workers,
+            "columns": {}
         }
 
         # Fill out data
-        for field_name in h5_file["data"]:
-            parser = h5_file["data"][field_name].attrs.get("parser")
+        data_group = h5_file["data"]
+
+        for field_name in data_group:
+            field_attrs = data_group[field_name].attrs
+            parser = field_attrs.get("parser")
 
             if parser is None:
                 continue
@@ -108,13 +126,31 @@ def cmd_unpack(args: Namespace) -> None:
                     output_dir=output_dir,
                     dataset_name=dataset_name,
                     field_name=field_name,
-                    data=h5_file["data"],
-                    attrs=h5_file["data"][field_name].attrs,
+                    data=data_group,
+                    attrs=field_attrs,
                     ctx=ctx
                 )
 
                 print(f"Field 'data/{field_name}' successfully unpacked")
         
+        # Write all columns at once with the streaming writers
+        if args.format == "parquet":
+            pl.DataFrame(
+                list(ctx["columns"].values())
+            ).lazy().sink_parquet(
+                dataset,
+                compression="zstd",
+                compression_level=3
+            )
+
+        elif ctx["columns"]:
+            pl.DataFrame(
+                list(ctx["columns"].values())
+            ).lazy().sink_csv(dataset)
+        
+        else:
+            open(dataset, "w").close()
+
         with open(os.path.join(args.output, "h5pack.yaml"), "w") as f:
             yaml.dump(h5pack_yaml, f, sort_keys=False, allow_unicode=True)
     
@@ -8,6 +8,7 @@ from typing import (
 )
 from datetime import datetime
 from argparse import Namespace
+from multiprocessing import Queue
 from importlib.metadata import version
 from ..core.guards import is_file_with_ext
 from ..core.display import exit_error
@@ -18,6 +19,22 @@ from ..core.io import (
 )
 from ..data import get_parsers_map
 
+# Progress queue of pool worker processes (see `init_partition_worker`)
+_worker_queue = None
+
+
+def init_partition_worker(queue: Queue) -> None:
+    """Initializes a worker process of a partition pool.
+
+    A `multiprocessing.Queue` cannot be pickled as part of the task arguments,
+    so it is handed to each worker once when the pool is created.
+
+    Args:
+        queue (Queue): Queue used to report progress to the main process.
+    """
+    global _worker_queue
+    _worker_queue = queue
+
 
 def create_partition_from_data(
         idx: int,
@@ -39,6 +56,10 @@ def create_partition_from_data(
     Returns:
         (Tuple[int, str]): Partition index and generated `.h5` filename.
     """
+    # Pool workers get the progress queue through `init_partition_worker`
+    if "queue" not in ctx:
+        ctx = {**ctx, "queue": _worker_queue}
+
     # Create file
     h5_filename = add_extension(args.output, ext=".h5")
 
@@ -98,6 +119,40 @@ def create_partition_from_data(
     return idx, h5_filename
 
 
+def create_partitions_from_data(
+        idxs: List[int],
+        specs: dict,
+        data: pl.DataFrame,
+        args: Namespace,
+        ctx: dict = {}
+) -> List[Tuple[int, str]]:
+    """Creates a batch of partition files from a given `DataFrame`. Pool
+    workers receive one batch per task, so the input data is pickled once per
+    batch instead of once per partition.
+
+    Args:
+        idxs (List[int]): Partition indices.
+        specs (dict): Set of specifications used to process the data.
+        data (pl.DataFrame): Input `DataFrame` containing the raw data.
+        args (Namespace): User provided arguments.
+        ctx (dict): Context information.
+    
+    Returns:
+        (List[Tuple[int, str]]): Partition index and generated `.h5` filename
+            of each partition.
+    """
+    return [
+        create_partition_from_data(
+            idx=idx,
+            specs=specs,
+            data=data,
+            args=args,
+            ctx=ctx
+        )
+        for idx in idxs
+    ]
+
+
 def create_virtual_dataset_from_partitions(
         file: str,
         partitions: List[str],
@@ -119,6 +174,10 @@ def create_virtual_dataset_from_partitions(
         if not is_file_with_ext(partition, ext=".h5"):
             exit_error(f"Invalid partition file '{partition}'")
     
+    # NOTE: Relative paths may create an empty virtual dataset
+    if force_abspath:
+        partitions = [os.path.abspath(p) for p in partitions]
+
     virtual_specs = {"file": file, "fields": {}}
     partition_specs = []
     accum_idx = {}
@@ -127,11 +186,7 @@ def create_virtual_dataset_from_partitions(
         with h5py.File(partition) as f:
             partition_specs.append(
                 {
-                    # NOTE: Relative path may create empty virtual dataset
-                    "file": (
-                        os.path.abspath(partition) if force_abspath
-                        else partition
-                    ),
+                    "file": partition,
                     "fields": {},
                     "attrs": dict(f.attrs)
                 }
@@ -145,6 +200,35 @@ def create_virtual_dataset_from_partitions(
                         "attrs": dict(field_data.attrs)
                     }
                 
+                # Fixed length strings may have a different length in each
+                # partition, so the longest one is used to avoid truncation.
+                # If any partition has variable length strings, all of them
+                # are mapped as variable length strings
+                elif (
+                    field_data.dtype
+                    != virtual_specs["fields"][field_name]["dtype"]
+                ):
+                    virtual_field = virtual_specs["fields"][field_name]
+                    virtual_dtype = virtual_field["dtype"]
+                    is_str = [
+                        h5py.check_string_dtype(dt) is not None
+                        for dt in (field_data.dtype, virtual_dtype)
+                    ]
+
+                    if field_data.dtype.kind == virtual_dtype.kind == "S":
+                        if field_data.dtype.itemsize > virtual_dtype.itemsize:
+                            virtual_field["dtype"] = field_data.dtype
+                    
+                    elif all(is_str):
+                        virtual_field["dtype"] = h5py.string_dtype()
+                    
+                    else:
+                        exit_error(
+                            f"Field '{field_name}' of partition '{partition}' "
+                            f"has data type '{field_data.dtype}' but previous "
+                            f"partitions have data type '{virtual_dtype}'"
+                        )
+                
                 virtual_specs["fields"][field_name]["shape"] = (
                     field_data.shape
                     if virtual_specs["fields"][field_name].get("shape") is None
@@ -192,6 +276,8 @@ def create_virtual_dataset_from_partitions(
                 dtype=specs["fields"][field_name]["dtype"]
             )
 
+            # NOTE: Each source is mapped whole. Slicing it (`src[...]`) would
+            # copy the `VirtualSource` for every mapping
             start_idx = specs["fields"][field_name]["start_idx"]
             end_idx = specs["fields"][field_name]["end_idx"]
             layouts[field_name][start_idx:end_idx, ...] = src
@@ -1,11 +1,11 @@
 import os
+import stat
 import fnmatch
 from argparse import Namespace
 from ..core.io import (
     add_extension,
     get_dir_files
 )
-from ..core.guards import is_file_with_ext
 from ..core.display import (
     ask_confirmation,
     exit_error,
@@ -40,10 +40,17 @@ def cmd_virtual(args: Namespace) -> None:
     print("Collecting input files ...")
     
     for file_or_dir in args.input:
-        if is_file_with_ext(file_or_dir, ext=".h5"):
+        # Single stat call per input to tell files and folders apart
+        try:
+            mode = os.stat(file_or_dir).st_mode
+        
+        except OSError:
+            continue
+
+        if stat.S_ISREG(mode) and file_or_dir.endswith(".h5"):
             h5_files.append(file_or_dir)
         
-        elif os.path.isdir(file_or_dir):
+        elif stat.S_ISDIR(mode):
             h5_files += get_dir_files(
                 dir=file_or_dir,
                 ext=".h5",
@@ -69,7 +76,7 @@ def cmd_virtual(args: Namespace) -> None:
             if fnmatch.fnmatch(f, args.select):
                 selected_files.append(f)
         
-        h5_files = [f for f in h5_files if f in selected_files]
+        h5_files = selected_files
 
         if len(h5_files) == 0:
             exit_warning(
@@ -84,11 +91,11 @@ def cmd_virtual(args: Namespace) -> None:
     if args.filter is not None:
         print(f"Applying --filter pattern '{args.filter}' ...")
 
-        filtered_files = []
+        filtered_files = set()
 
         for f in h5_files:
             if fnmatch.fnmatch(f, args.filter):
-                filtered_files.append(f)
+                filtered_files.add(f)
         
         h5_files = [f for f in h5_files if f not in filtered_files]
 
@@ -102,10 +109,10 @@ def cmd_virtual(args: Namespace) -> None:
                 f"{len(h5_files)} selected .h5 file(s) after applying --filter"
             )
 
+    # NOTE: h5_files is never empty here since every empty selection above
+    # exits through exit_warning before the listing is built
     partition_files_repr = "\n".join(
-        [
-            f"  {idx}. '{f}'" for idx, f in enumerate(h5_files, start=1)
-        ]
+        f"  {idx}. '{f}'" for idx, f in enumerate(h5_files, start=1)
     )
 
     print(
@@ -119,7 +126,7 @@ def cmd_virtual(args: Namespace) -> None:
     # Create virtual dataset
     output_file = add_extension(args.output, ext=".h5")
     create_virtual_dataset_from_partitions(
-        file=add_extension(args.output, ext=".h5"),
+        file=output_file,
         partitions=h5_files,
         attrs=root_attrs,
         force_abspath=args.force_abspath
@@ -71,13 +71,19 @@ class __Config__(metaclass=__Singleton__):
         ]
 
 
+# Pre-instantiated singleton to skip the metaclass dispatch on every access
+_CONFIG = __Config__()
+_TEXT_COLOR_TAGS = _CONFIG._TEXT_COLOR_TAGS
+_TEXT_DECORATOR_TAGS = _CONFIG._TEXT_DECORATOR_TAGS
+
+
 def _get_text_color_tags() -> dict:
     """Returns all available text color tags.
     
     Returns:
         dict: Text color tags.
     """
-    return __Config__()._TEXT_COLOR_TAGS
+    return _CONFIG._TEXT_COLOR_TAGS
 
 
 def _get_text_decorator_tags() -> dict:
@@ -86,7 +92,7 @@ def _get_text_decorator_tags() -> dict:
     Returns:
         dict: Decorator tags.
     """
-    return __Config__()._TEXT_DECORATOR_TAGS
+    return _CONFIG._TEXT_DECORATOR_TAGS
 
 
 def get_allowed_audio_extensions() -> List[str]:
@@ -95,4 +101,4 @@ def get_allowed_audio_extensions() -> List[str]:
     Returns:
         List[str]: List of allowed audio extensions.
     """
-    return __Config__()._ALLOWED_AUDIO_EXTENSIONS
+    return _CONFIG._ALLOWED_AUDIO_EXTENSIONS
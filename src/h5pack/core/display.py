@@ -1,14 +1,24 @@
+import re
 import sys
+from functools import lru_cache
 from tqdm import tqdm
 from typing import Optional
 from .config import (
-    _get_text_color_tags,
-    _get_text_decorator_tags
+    _TEXT_COLOR_TAGS,
+    _TEXT_DECORATOR_TAGS
 )
 
+# All tags are replaced in a single pass over the input string. Longer tags
+# go first so that a tag that is a prefix of another one never shadows it
+_TAG_TABLE = {**_TEXT_DECORATOR_TAGS, **_TEXT_COLOR_TAGS}
+_TAG_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_TAG_TABLE, key=len, reverse=True))
+)
 
-def _decorate_str(s: str) -> str:
-    """Replace colors and decorators in a string.
+
+@lru_cache(maxsize=512)
+def _decorate_str_cached(s: str) -> str:
+    """Cached implementation of `_decorate_str`.
 
     Args:
         s (str): The input string to be decorated.
@@ -17,13 +27,23 @@ def _decorate_str(s: str) -> str:
         str: The decorated string.
     """
     # Replace colors and decorators
-    for k, v in _get_text_decorator_tags().items():
-        s = s.replace(k, v)
+    return _TAG_RE.sub(lambda m: _TAG_TABLE[m.group(0)], s)
+
+
+def _decorate_str(s: str) -> str:
+    """Replace colors and decorators in a string.
+
+    Args:
+        s (str): The input string to be decorated.
 
-    for k, v in _get_text_color_tags().items():
-        s = s.replace(k, v)
+    Returns:
+        str: The decorated string.
+    """
+    # Most messages contain no tags at all
+    if "<" not in s:
+        return s
 
-    return s
+    return _decorate_str_cached(s)
 
 
 def printc(s: str, writer: Optional[tqdm] = None) -> None:
@@ -1,7 +1,13 @@
 import os
+import struct
 import numpy as np
+import polars as pl
 import soundfile as sf
-from glob import glob
+from glob import has_magic
+from fnmatch import fnmatchcase
+from itertools import chain
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Callable,
     List,
@@ -49,6 +55,80 @@ def add_suffix(file: str, suffix: str) -> str:
     return f"{filename}{suffix}{ext}"
 
 
+def resolve_paths(files: pl.Series, root_dir: str) -> List[str]:
+    """Prepends a root folder to the relative paths of a column of paths.
+
+    Args:
+        files (pl.Series): Column of absolute or relative paths.
+        root_dir (str): Folder relative paths are relative to.
+
+    Returns:
+        List[str]: Absolute paths, or paths joined with `root_dir`.
+    """
+    # On POSIX absolute paths are the ones starting with "/", so all paths are
+    # solved by a single Polars expression
+    if os.name == "posix":
+        return files.to_frame().select(
+            pl.when(pl.first().str.starts_with("/"))
+            .then(pl.first())
+            .otherwise(pl.lit(os.path.join(root_dir, "")) + pl.first())
+        ).to_series().to_list()
+
+    return [
+        f if os.path.isabs(f) else os.path.join(root_dir, f)
+        for f in files.to_list()
+    ]
+
+
+def _get_dir_files(
+        dir: str,
+        ext: List[str],
+        recursive: bool = True
+) -> List[str]:
+    """Returns an unsorted `list` with all the files inside a single folder
+    with any of the extensions in `ext`.
+
+    Args:
+        dir (str): Folder to be searched.
+        ext (List[str]): File extensions to be considered. Accepts `.*` as a
+            wild card.
+        recursive (bool): If `True`, the search will be recursive.
+
+    Returns:
+        `list` of `str` with the path to each retrieved file.
+    """
+    # Plain extensions are matched in a single endswith() call, only wild
+    # cards fall back to pattern matching
+    ext_tuple = tuple(e for e in ext if not has_magic(e))
+    ext_patterns = [f"*{e}" for e in ext if has_magic(e)]
+    files = []
+    pending_dirs = [dir]
+
+    while pending_dirs:
+        try:
+            entries = os.scandir(pending_dirs.pop())
+
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                # Hidden entries are skipped the same way glob does
+                if entry.name.startswith("."):
+                    continue
+
+                if recursive and entry.is_dir():
+                    pending_dirs.append(entry.path)
+
+                elif entry.is_file() and (
+                    entry.name.endswith(ext_tuple)
+                    or any(fnmatchcase(entry.name, p) for p in ext_patterns)
+                ):
+                    files.append(entry.path)
+
+    return files
+
+
 def get_dir_files(
         dir: Union[str, List[str]],
         ext: Union[str, List[str]] = ".wav",
@@ -83,30 +163,16 @@ def get_dir_files(
         if not os.path.isdir(dir_):
             raise FolderNotFoundError(f"Folder not found: '{dir_}'")
 
-    all_files = []
-
-    # Search dirs
-    for dir_ in dir:
-        for ext_ in ext:
-            if recursive:
-                all_files.extend(
-                    list(
-                        glob(os.path.join(dir_, "**", f"*{ext_}"),
-                             recursive=True)
-                    )
+    # Search dirs concurrently since listing folders is mostly I/O wait
+    with ThreadPoolExecutor(max_workers=max(1, min(len(dir), 8))) as executor:
+        all_files = list(
+            chain.from_iterable(
+                executor.map(
+                    lambda dir_: _get_dir_files(dir_, ext, recursive),
+                    dir
                 )
-            else:
-                all_files.extend(list(glob(os.path.join(dir_, f"*{ext_}"))))
-    
-    # Filter out f olders with file-like names (e.g. ending in .wav extension)
-    flagged_files = []
-
-    for file in all_files:
-        if not os.path.isfile(file):
-            flagged_files.append(file)
-    
-    for flagged_file in flagged_files:
-        all_files.remove(flagged_file)
+            )
+        )
 
     return sorted(all_files, key=key)
 
@@ -124,16 +190,32 @@ def read_audio_metadata(file: str) -> dict:
             (``duration_seconds``), audio format (``fmt``), and audio subtype
             (``subtype``).
     """
-    info = sf.info(file, verbose=False)
+    # Only the header fields are read, unlike `sf.info` which also queries
+    # the log and format descriptions of libsndfile
+    with sf.SoundFile(file) as f:
+        return {
+            "fs": f.samplerate,
+            "num_channels": f.channels,
+            "num_samples_per_channel": f.frames,
+            "duration_seconds": f.frames / f.samplerate,
+            "fmt": f.format,
+            "subtype": f.subtype
+        }
 
-    return {
-        "fs": info.samplerate,
-        "num_channels": info.channels,
-        "num_samples_per_channel": info.frames,
-        "duration_seconds": info.duration,
-        "fmt": info.format,
-        "subtype": info.subtype
-    }
+
+@lru_cache(maxsize=65536)
+def read_audio_metadata_cached(file: str) -> dict:
+    """Cached version of `read_audio_metadata`. Files read during validation
+    are not read again by the parsers.
+    
+    Args:
+        file (str): Audio file.
+    
+    Returns:
+        dict: Metadata of the audio file. The returned `dict` is shared
+            between calls and should not be modified.
+    """
+    return read_audio_metadata(file)
 
 
 def read_audio(
@@ -173,6 +255,115 @@ def read_audio(
     return data.transpose(), fs_
 
 
+# WAV format tags and sample sizes that can be copied as is into a buffer of
+# each data type
+_WAV_FORMAT_PCM = 0x0001
+_WAV_FORMAT_IEEE_FLOAT = 0x0003
+_WAV_FORMAT_EXTENSIBLE = 0xFFFE
+_WAV_RAW_FORMATS = {
+    np.dtype(np.int16): (_WAV_FORMAT_PCM, 16),
+    np.dtype(np.float32): (_WAV_FORMAT_IEEE_FLOAT, 32),
+    np.dtype(np.float64): (_WAV_FORMAT_IEEE_FLOAT, 64)
+}
+
+
+def _read_wav_into(file: str, out: np.ndarray) -> bool:
+    """Copies the samples of a mono `.wav` file into a buffer without decoding
+    them, if they are already stored with the data type of the buffer.
+
+    Args:
+        file (str): Audio file.
+        out (np.ndarray): 1D buffer where the audio samples are written.
+    
+    Returns:
+        bool: ``True`` if the samples were copied into ``out``, ``False`` if
+            the file cannot be copied as is.
+    """
+    if (
+        not np.little_endian
+        or not out.flags.c_contiguous
+        or out.dtype not in _WAV_RAW_FORMATS
+    ):
+        return False
+    
+    raw_tag, raw_bits = _WAV_RAW_FORMATS[out.dtype]
+
+    with open(file, "rb") as f:
+        header = f.read(12)
+
+        if len(header) < 12:
+            return False
+
+        riff, _, wave = struct.unpack("<4sI4s", header)
+
+        if riff != b"RIFF" or wave != b"WAVE":
+            return False
+        
+        fmt = None
+
+        # Chunks are visited until the data chunk is found
+        while len(header := f.read(8)) == 8:
+            chunk_id, chunk_size = struct.unpack("<4sI", header)
+
+            if chunk_id == b"fmt ":
+                fmt_data = f.read(chunk_size + chunk_size % 2)
+
+                if len(fmt_data) < 16:
+                    return False
+
+                fmt_tag, num_channels, _, _, _, bits = struct.unpack(
+                    "<HHIIHH",
+                    fmt_data[:16]
+                )
+
+                # Actual format tag is the start of the sub format GUID
+                if fmt_tag == _WAV_FORMAT_EXTENSIBLE and len(fmt_data) >= 26:
+                    fmt_tag = struct.unpack("<H", fmt_data[24:26])[0]
+
+                fmt = (fmt_tag, num_channels, bits)
+
+            elif chunk_id == b"data":
+                if fmt != (raw_tag, 1, raw_bits) or chunk_size != out.nbytes:
+                    return False
+                
+                return f.readinto(out) == out.nbytes
+
+            else:
+                f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+
+    return False
+
+
+def read_audio_into(file: str, out: np.ndarray) -> bool:
+    """Reads a mono audio file directly into a preallocated buffer if it has
+    exactly as many samples as the buffer.
+
+    Args:
+        file (str): Audio file.
+        out (np.ndarray): 1D buffer where the audio samples are written. Its
+            data type is used to represent the data.
+    
+    Returns:
+        bool: ``True`` if the audio was read into ``out``, ``False`` if the
+            file is not mono or has a different number of samples, in which
+            case the contents of ``out`` should not be used.
+    """
+    is_file_or_error(file)
+
+    # Uncompressed .wav files with the same data type as the buffer are copied
+    # without going through libsndfile
+    if file.lower().endswith(".wav") and _read_wav_into(file, out):
+        return True
+
+    with sf.SoundFile(file) as f:
+        if f.channels != 1 or f.frames != len(out):
+            return False
+
+        f.read(dtype=out.dtype.name, out=out)
+
+    return True
+
+
 def write_audio(
         audio: np.ndarray,
         file: str,
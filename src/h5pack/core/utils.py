@@ -217,9 +217,14 @@ def get_file_checksum(file: str, hash: str = "sha256") -> str:
 
     hash_gen = available_hashes[hash]
 
+    # Stream the file instead of loading it into memory at once
     with open(file, "rb") as f:
-        content = f.read()
-        hash_gen.update(content)
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            hash_gen = hashlib.file_digest(f, lambda: hash_gen)
+        
+        else:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hash_gen.update(chunk)
 
     return hash_gen.hexdigest()
 
@@ -34,6 +34,84 @@ from .validators import (
 )
 
 
+# NOTE: Dispatch tables are read-only and built once at import time
+_PARSERS_MAP = {
+    pl.String: {
+        "as_audioint16": as_audioint16,
+        "as_audiofloat32": as_audiofloat32,
+        "as_audiofloat64": as_audiofloat64,
+        "as_utf8str": as_utf8str,
+        "as_listint16": as_listint16,
+        "as_listint8": as_listint8,
+        "as_listfloat32": as_listfloat32,
+        "as_listfloat64": as_listfloat64,
+    },
+    pl.Int8: {
+        "as_int8": as_int8,
+        "as_int16": as_int16,
+        "as_float32": as_float32,
+        "as_float64": as_float64
+    },
+    pl.Int16: {
+        "as_int8": as_int8,
+        "as_int16": as_int16,
+        "as_float32": as_float32,
+        "as_float64": as_float64
+    },
+    pl.Int32: {
+        "as_int8": as_int8,
+        "as_int16": as_int16,
+        "as_float32": as_float32,
+        "as_float64": as_float64
+    },
+    pl.Int64: {
+        "as_int8": as_int8,
+        "as_int16": as_int16,
+        "as_float32": as_float32,
+        "as_float64": as_float64
+    },
+    pl.Int128: {
+        "as_int8": as_int8,
+        "as_int16": as_int16,
+        "as_float32": as_float32,
+        "as_float64": as_float64
+    },
+    pl.Float32: {
+        "as_int8": as_int8,
+        "as_int16": as_int16,
+        "as_float32": as_float32,
+        "as_float64": as_float64
+    },
+    pl.Float64: {
+        "as_int8": as_int8,
+        "as_int16": as_int16,
+        "as_float32": as_float32,
+        "as_float64": as_float64
+    }
+}
+
+_EXTRACTORS_MAP = {
+    "as_audioint16": from_audioint16,
+    "as_audiofloat32": from_audiofloat32,
+    "as_audiofloat64": from_audiofloat64,
+    "as_int8": from_int8,
+    "as_int16": from_int16,
+    "as_float32": from_float32,
+    "as_float64": from_float64,
+    "as_utf8str": from_utf8str,
+    "as_listint8": from_listint8,
+    "as_listint16": from_listint16,
+    "as_listfloat32": from_listfloat32,
+    "as_listfloat64": from_listfloat64
+}
+
+_VALIDATORS_MAP = {
+    "as_audioint16": [validate_file_as_audioint16],
+    "as_audiofloat32": [validate_file_as_audiofloat32],
+    "as_audiofloat64": [validate_file_as_audiofloat64]
+}
+
+
 def get_parsers_map() -> dict:
     """Mapping between parsers defined by the user and parser functions based
     on `polars` data types used to read each column in the input `.csv` file.
@@ -41,60 +119,8 @@ def get_parsers_map() -> dict:
     Returns:
         dict: Mapping `str` values and the corresponding parsers.
     """
-    return {
-        pl.String: {
-            "as_audioint16": as_audioint16,
-            "as_audiofloat32": as_audiofloat32,
-            "as_audiofloat64": as_audiofloat64,
-            "as_utf8str": as_utf8str,
-            "as_listint16": as_listint16,
-            "as_listint8": as_listint8,
-            "as_listfloat32": as_listfloat32,
-            "as_listfloat64": as_listfloat64,
-        },
-        pl.Int8: {
-            "as_int8": as_int8,
-            "as_int16": as_int16,
-            "as_float32": as_float32,
-            "as_float64": as_float64
-        },
-        pl.Int16: {
-            "as_int8": as_int8,
-            "as_int16": as_int16,
-            "as_float32": as_float32,
-            "as_float64": as_float64
-        },
-        pl.Int32: {
-            "as_int8": as_int8,
-            "as_int16": as_int16,
-            "as_float32": as_float32,
-            "as_float64": as_float64
-        },
-        pl.Int64: {
-            "as_int8": as_int8,
-            "as_int16": as_int16,
-            "as_float32": as_float32,
-            "as_float64": as_float64
-        },
-        pl.Int128: {
-            "as_int8": as_int8,
-            "as_int16": as_int16,
-            "as_float32": as_float32,
-            "as_float64": as_float64
-        },
-        pl.Float32: {
-            "as_int8": as_int8,
-            "as_int16": as_int16,
-            "as_float32": as_float32,
-            "as_float64": as_float64
-        },
-        pl.Float64: {
-            "as_int8": as_int8,
-            "as_int16": as_int16,
-            "as_float32": as_float32,
-            "as_float64": as_float64
-        }
-    }
+    return _PARSERS_MAP
+
 
 def get_extractors_map() -> dict:
     """Mapping between extractor identifiers and extractor methods.
@@ -102,20 +128,7 @@ def get_extractors_map() -> dict:
     Returns:
         dict: Mapping between extractor identifiers and extractor methods.
     """
-    return {
-        "as_audioint16": from_audioint16,
-        "as_audiofloat32": from_audiofloat32,
-        "as_audiofloat64": from_audiofloat64,
-        "as_int8": from_int8,
-        "as_int16": from_int16,
-        "as_float32": from_float32,
-        "as_float64": from_float64,
-        "as_utf8str": from_utf8str,
-        "as_listint8": from_listint8,
-        "as_listint16": from_listint16,
-        "as_listfloat32": from_listfloat32,
-        "as_listfloat64": from_listfloat64
-    }
+    return _EXTRACTORS_MAP
 
 
 def get_validators_map() -> dict:
@@ -126,8 +139,4 @@ def get_validators_map() -> dict:
             Each method can be a `list` of one or more methods that are applied
             in series.
     """
-    return {
-        "as_audioint16": [validate_file_as_audioint16],
-        "as_audiofloat32": [validate_file_as_audiofloat32],
-        "as_audiofloat64": [validate_file_as_audiofloat64]
-    }
+    return _VALIDATORS_MAP
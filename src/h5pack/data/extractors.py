@@ -1,9 +1,89 @@
 import os
 import h5py
+import numpy as np
 import polars as pl
+from queue import Queue
+from threading import Thread
+from typing import List
 from packaging import version
+from rich.progress import (
+    Progress,
+    TaskID
+)
 from ..core.io import write_audio
 
+# Approximate size of each block of fixed length audio read at once
+_READ_BLOCK_NBYTES = 64 * 1024 * 1024
+
+# Number of rows of vlen audio read at once
+_VLEN_READ_BLOCK_LEN = 256
+
+# Maximum number of audio files waiting to be written
+_WRITE_QUEUE_MAXSIZE = 64
+
+
+def _add_column(series: pl.Series, ctx: dict) -> None:
+    """Adds a column to the annotations file (`dataset.csv` or
+    `dataset.parquet`). Columns are accumulated in the extraction context and
+    written all at once after every field has been extracted.
+
+    Args:
+        series (pl.Series): Column to add.
+        ctx (dict): Extraction context.
+    """
+    ctx["columns"][series.name] = series
+
+
+def _audio_writer(
+        queue: Queue,
+        progress_bar: Progress,
+        task: TaskID,
+        errors: List[Exception]
+) -> None:
+    """Writes the audio files taken from a queue until a `None` item is found.
+
+    Args:
+        queue (Queue): Queue of `(audio, file, fs, released)` items to write.
+            If `released` is not `None`, it is a queue where a token is put
+            once `audio` is no longer needed.
+        progress_bar (Progress): Progress bar advanced after each file.
+        task (TaskID): Progress bar task.
+        errors (List[Exception]): Errors raised while writing. Once an error
+            is found, remaining items are consumed but not written.
+    """
+    while (item := queue.get()) is not None:
+        audio, file, fs, released = item
+
+        try:
+            if not errors:
+                write_audio(audio, file, fs)
+                progress_bar.advance(task)
+
+        except Exception as e:
+            errors.append(e)
+
+        finally:
+            if released is not None:
+                released.put(None)
+
+
+def _decode_str_dataset(dataset: h5py.Dataset) -> np.ndarray:
+    """Reads a string dataset and decodes all its values at once.
+
+    Args:
+        dataset (h5py.Dataset): Dataset of UTF-8 encoded strings.
+
+    Returns:
+        np.ndarray: Decoded strings.
+    """
+    values = dataset[:]
+
+    # h5py returns variable length strings as an object array of bytes
+    if values.dtype.kind in ("O", "S"):
+        values = np.char.decode(values.astype("S"), "utf-8")
+
+    return values
+
 
 def _from_audiodtype(
         output_csv: str,
@@ -37,84 +117,129 @@ def _from_audiodtype(
             }
         }
     )
-
-    # Make output folder if it does not exist
-    os.makedirs(output_dir, exist_ok=True)
  
     # Get file path and sample rate
-    filenames = (
-        [s.decode("utf-8") for s in data[f"{field_name}__filepath"]]
+    filenames = _decode_str_dataset(
+        data[f"{field_name}__filepath"]
         if ctx["producer_version"] >= version.parse("1.0.1")  # Legacy
-        else
-        [s.decode("utf-8") for s in data[f"{field_name}_filepaths"]]
+        else data[f"{field_name}_filepaths"]
+    ).tolist()
+    fs = int(attrs["sample_rate"])
+
+    # Make output folders if they do not exist, once per distinct folder
+    for dirname in {os.path.dirname(f) for f in filenames} | {""}:
+        os.makedirs(os.path.join(output_dir, dirname), exist_ok=True)
+
+    # Add paths to csv
+    _add_column(
+        pl.select(
+            pl.concat_str(
+                pl.lit(os.path.join("data", field_name, "")),
+                pl.Series(filenames, dtype=pl.String)
+            ).alias(f"{field_name}__filepath")
+        ).to_series(),
+        ctx=ctx
     )
-    fs = attrs["sample_rate"]
 
-    # Write paths to csv
-    if os.path.getsize(output_csv) > 0:  # Polars cannot read empty .csv
-        df = pl.read_csv(output_csv, n_rows=0)
-    
-    else:
-        df = pl.DataFrame()
-    
-    df = df.with_columns(
-        pl.Series(
-            name=f"{field_name}__filepath",
-            values=[os.path.join("data", field_name, f) for f in filenames],
-            dtype=pl.String
-        )
-    )
-    df.write_csv(output_csv)
+    # Output audio files
+    files = [os.path.join(output_dir, f) for f in filenames]
 
     # Get progress bar
     progress_bar = ctx["progress_bar"]
 
+    # Audio files are encoded and written by background threads while the
+    # next rows are read. libsndfile releases the GIL while writing
+    num_writers = max(1, ctx.get("workers", 1))
+    queue = Queue(maxsize=_WRITE_QUEUE_MAXSIZE)
+    errors = []
+
     with progress_bar:
         # Add task
         task = progress_bar.add_task(
             f"Unpacking '{field_name}'",
             total=len(filenames)
         )
-
-        if data[field_name].ndim == 2:  # Fixed length audio
-            for row_idx, filename in zip(
-                range(data[field_name].shape[0]),
-                filenames
+        writers = [
+            Thread(
+                target=_audio_writer,
+                args=(queue, progress_bar, task, errors),
+                daemon=True
+            )
+            for _ in range(num_writers)
+        ]
+
+        for writer in writers:
+            writer.start()
+
+        # Audio is read in blocks of rows instead of one row at a time
+        audio_data = data[field_name]
+        num_rows = audio_data.shape[0]
+        buffers = None
+
+        if audio_data.ndim == 2:  # Fixed length audio
+            row_nbytes = audio_data.shape[1] * audio_data.dtype.itemsize
+            block_len = max(1, _READ_BLOCK_NBYTES // max(1, row_nbytes))
+            block_len = min(block_len, max(1, num_rows))
+
+            # Blocks are read in place into two reusable buffers: one is
+            # filled while the rows of the other one are being written
+            if audio_data.shape[1] > 0:
+                buffers = [
+                    np.empty(
+                        (block_len, audio_data.shape[1]),
+                        dtype=audio_data.dtype
+                    )
+                    for _ in range(2)
+                ]
+                released = [Queue(), Queue()]
+                pending = [0, 0]
+
+        elif audio_data.ndim == 1:  # vlen audio
+            block_len = _VLEN_READ_BLOCK_LEN
+
+        try:
+            for block_idx, start_idx in enumerate(
+                range(0, num_rows, block_len)
             ):
-                # Make step
-                progress_bar.advance(task)
+                if errors:
+                    break
 
-                # Extract file
-                os.makedirs(
-                    os.path.join(output_dir, os.path.dirname(filename)),
-                    exist_ok=True
-                )
-                audio = data[field_name][row_idx, :]
-                write_audio(
-                    audio,
-                    file=os.path.join(output_dir, filename),
-                    fs=int(fs)
-                )
-        
-        elif data[field_name].ndim == 1:  # vlen audio
-            for row_idx, filename in zip(
-                range(data[field_name].shape[0]),
-                filenames
-            ):
-                # Make step
-                progress_bar.advance(task)
+                end_idx = min(start_idx + block_len, num_rows)
+                block_files = files[start_idx:end_idx]
+
+                if buffers is None:
+                    block = audio_data[start_idx:end_idx]
+                    block_released = None
 
-                # Extract file
-                os.makedirs(
-                    os.path.join(output_dir, os.path.dirname(filename)),
-                    exist_ok=True
-                )
-                audio = data[field_name][row_idx]
-                write_audio(
-                    audio,
-                    file=os.path.join(output_dir, filename),
-                    fs=int(fs)
-                ) 
+                else:
+                    slot = block_idx % 2
+
+                    # Wait for the rows previously read into this buffer
+                    for _ in range(pending[slot]):
+                        released[slot].get()
+
+                    audio_data.read_direct(
+                        buffers[slot],
+                        source_sel=np.s_[start_idx:end_idx],
+                        dest_sel=np.s_[:end_idx - start_idx]
+                    )
+                    block = buffers[slot][:end_idx - start_idx]
+                    block_released = released[slot]
+                    pending[slot] = len(block)
+
+                # Extract files
+                for audio, file in zip(block, block_files):
+                    queue.put((audio, file, fs, block_released))
+
+        finally:
+            for _ in writers:
+                queue.put(None)
+
+            for writer in writers:
+                writer.join()
+
+    if errors:
+        raise errors[0]
 
 
 def from_audioint16(
@@ -167,6 +292,7 @@ def from_audiofloat64(
         output_csv: str,
         output_yaml: str,
         output_dir: str,
+        dataset_name: str,
         field_name: str,
         data: h5py.Dataset,
         attrs: h5py.AttributeManager,
@@ -175,7 +301,9 @@ def from_audiofloat64(
     """Alias of generic extractor for audio data as `float64`."""
     return _from_audiodtype(
         output_csv=output_csv,
+        output_yaml=output_yaml,
         output_dir=output_dir,
+        dataset_name=dataset_name,
         field_name=field_name,
         data=data,
         attrs=attrs,
@@ -216,17 +344,13 @@ def _from_dtype(
         }
     )
 
-    # Write data to .csv
-    if os.path.getsize(output_csv) == 0:
-        df = pl.DataFrame()
-    
-    else:
-        df = pl.read_csv(output_csv)
-    
-    df = df.with_columns(
-        pl.Series(field_name, list(data[field_name]), pl.Float32)
+    # Add data to .csv
+    # Values keep their stored data type so the array is wrapped without a
+    # copy
+    _add_column(
+        pl.from_numpy(data[field_name][:], schema=[field_name]).to_series(),
+        ctx=ctx
     )
-    df.write_csv(output_csv)
 
 
 def from_int8(
@@ -342,19 +466,11 @@ def from_utf8str(
         }
     )
 
-    # Write data to .csv
-    if os.path.getsize(output_csv) == 0:
-        df = pl.DataFrame()
-    
-    else:
-        df = pl.read_csv(output_csv)
-
-    decoded_data = [
-        i.decode("utf-8") if isinstance(i, bytes)
-        else i for i in data[field_name]
-    ]
-    df = df.with_columns(pl.Series(field_name, decoded_data, pl.Utf8))
-    df.write_csv(output_csv)
+    # Add data to .csv
+    _add_column(
+        pl.Series(field_name, _decode_str_dataset(data[field_name]), pl.Utf8),
+        ctx=ctx
+    )
 
 
 def _from_listdtype(
@@ -389,21 +505,29 @@ def _from_listdtype(
             }
         }
     )
-    # Write data to .csv
-    if os.path.getsize(output_csv) == 0:
-        df = pl.DataFrame()
-    
-    else:
-        df = pl.read_csv(output_csv)
-    
-    df = df.with_columns(
-        pl.Series(
-            field_name,
-            [str(r) for r in data[field_name][:].tolist()],
-            pl.String
-        )
+    # Add data to .csv
+    values = data[field_name][:]
+
+    # vlen lists are read as an object array of arrays and fixed length lists
+    # as a 2D array
+    lists = pl.Series(
+        field_name,
+        list(values) if values.dtype.kind == "O" else values
+    )
+
+    if isinstance(lists.dtype, pl.Array):
+        lists = lists.cast(pl.List(lists.dtype.inner))
+
+    # Lists are written as "[v1, v2, ...]" so they can be parsed back
+    _add_column(
+        lists.to_frame().select(
+            pl.format(
+                "[{}]",
+                pl.col(field_name).cast(pl.List(pl.String)).list.join(", ")
+            ).alias(field_name)
+        ).to_series(),
+        ctx=ctx
     )
-    df.write_csv(output_csv)
 
 
 def from_listint8(
@@ -3,12 +3,265 @@ import ast
 import h5py
 import polars as pl
 import numpy as np
-from typing import List
+import zlib
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    List,
+    Optional,
+    Tuple
+)
 from ..core.io import (
     read_audio,
-    read_audio_metadata
+    read_audio_into,
+    read_audio_metadata_cached,
+    resolve_paths
 )
-from ..core.guards import are_lists_equal_len
+
+# Audio rows are decoded and written to disk in blocks of about this size
+_WRITE_BLOCK_NBYTES = 64 * 1024 * 1024
+_VLEN_WRITE_BLOCK_LEN = 256
+
+# Fixed length audio is chunked by whole rows, with chunks of up to this size
+_MAX_CHUNK_NBYTES = 4 * 1024 * 1024
+_MAX_CHUNK_LEN = 64
+
+# libsndfile releases the GIL while decoding, so threads scale across files
+_MAX_DECODE_THREADS = min(8, os.cpu_count() or 1)
+
+# Number of decoded audio files reported at once to the progress queue
+_PROGRESS_STEP = 64
+
+# Compression level of the gzip filter
+_GZIP_LEVEL = 4
+
+
+def _get_compression_kwargs(ctx: dict) -> dict:
+    """Gets the `create_dataset` keyword arguments that enable the compression
+    selected in the context, if any.
+
+    Args:
+        ctx (dict): Dictionary containing context variables.
+
+    Returns:
+        dict: Keyword arguments for `create_dataset`.
+    """
+    compression = ctx.get("compression", "none")
+
+    if compression == "none":
+        return {}
+    
+    # Shuffling bytes groups similar bytes of the samples together, which
+    # improves the compression ratio of PCM audio
+    kwargs = {"compression": compression, "shuffle": True}
+
+    if compression == "gzip":
+        kwargs["compression_opts"] = _GZIP_LEVEL
+
+    return kwargs
+
+
+def _deflate_chunk(
+        rows: np.ndarray,
+        chunk_len: int,
+        shuffle: bool,
+        level: int
+) -> bytes:
+    """Applies the shuffle and gzip filters of a chunked dataset to a chunk of
+    rows, so it can be written without going through the HDF5 filters.
+
+    Args:
+        rows (np.ndarray): Rows of the chunk. The last chunk of a dataset may
+            have less than `chunk_len` rows.
+        chunk_len (int): Number of rows of each chunk of the dataset.
+        shuffle (bool): If `True`, bytes are shuffled before compressing them.
+        level (int): Compression level of the gzip filter.
+
+    Returns:
+        bytes: Filtered chunk.
+    """
+    # Edge chunks are stored with their full size
+    if len(rows) < chunk_len:
+        padded = np.zeros((chunk_len, *rows.shape[1:]), dtype=rows.dtype)
+        padded[:len(rows)] = rows
+        rows = padded
+
+    data = np.ascontiguousarray(rows)
+
+    if shuffle:
+        data = data.view(np.uint8).reshape(-1, rows.dtype.itemsize).T
+
+    return zlib.compress(data.tobytes(), level)
+
+
+def _slice_column(
+        data_frame: pl.DataFrame,
+        column_name: str,
+        start_idx: int,
+        end_idx: int
+) -> pl.Series:
+    """Gets the rows of a partition from a column without copying them.
+
+    Args:
+        data_frame (pl.DataFrame): `DataFrame` containing the column.
+        column_name (str): Column name.
+        start_idx (int): Index of first row.
+        end_idx (int): Index after the last row.
+
+    Returns:
+        pl.Series: Rows of the column between `start_idx` and `end_idx`.
+    """
+    return data_frame[column_name].slice(start_idx, end_idx - start_idx)
+
+
+def _check_int_range(values: np.ndarray, dtype: np.dtype, col: str) -> None:
+    """Checks that values fit in an integer data type, since casting them
+    with `astype()` would silently wrap them around.
+
+    Args:
+        values (np.ndarray): Values to be checked.
+        dtype (np.dtype): Target data type. Non integer types are not checked.
+        col (str): Column name used in the error message.
+    """
+    if (
+        np.issubdtype(dtype, np.integer)
+        and len(values) > 0
+        and (
+            values.min() < np.iinfo(dtype).min
+            or values.max() > np.iinfo(dtype).max
+        )
+    ):
+        raise OverflowError(
+            f"Column '{col}' has values out of the range of {dtype.name}"
+        )
+
+
+def _parse_lists(values: pl.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Parses a column of lists written as strings such as `"[1, 2, 3]"`.
+
+    Args:
+        values (pl.Series): Column of lists as strings.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Values of all lists concatenated and
+            length of each list.
+    """
+    # Lists are parsed as JSON by Polars, and only parsed one by one as Python
+    # literals if that fails
+    try:
+        lists = values.str.json_decode(pl.List(pl.Float64))
+
+    except pl.exceptions.ComputeError:
+        lists = pl.Series(
+            [ast.literal_eval(li) for li in values.to_list()],
+            dtype=pl.List(pl.Float64)
+        )
+
+    if lists.null_count() > 0:
+        raise ValueError(f"Column '{values.name}' has missing values")
+
+    lens = lists.list.len().to_numpy()
+
+    # NOTE: Empty lists are dropped since they are exploded as null
+    flat_values = lists.filter(lens > 0).explode()
+
+    if flat_values.null_count() > 0:
+        raise ValueError(f"Column '{values.name}' has missing values")
+
+    return flat_values.to_numpy(), lens
+
+
+def _read_audio_data(file: str, dtype: np.dtype) -> np.ndarray:
+    """Reads a mono audio file as a 1D `np.ndarray`.
+
+    Args:
+        file (str): Audio file.
+        dtype (np.dtype): Data type used to read the audio data.
+
+    Returns:
+        np.ndarray: Audio samples of the file.
+    """
+    data, _ = read_audio(file, dtype=dtype)
+    return data.reshape(-1)
+
+
+def _read_audio_row(file: str, row: np.ndarray) -> Optional[np.ndarray]:
+    """Reads a mono audio file into a row of a fixed length block.
+
+    Args:
+        file (str): Audio file.
+        row (np.ndarray): Row where the audio samples are written.
+
+    Returns:
+        Optional[np.ndarray]: `None` if the audio was read into `row`, or the
+            audio samples if the file length does not match the row length.
+    """
+    if read_audio_into(file, row):
+        return None
+
+    return _read_audio_data(file, dtype=row.dtype)
+
+
+def _write_vlen_rows(
+        dataset: h5py.Dataset,
+        start_idx: int,
+        rows: List[np.ndarray]
+) -> None:
+    """Writes consecutive rows to a vlen dataset in a single call.
+
+    Args:
+        dataset (h5py.Dataset): Vlen dataset.
+        start_idx (int): Index of the first row to write.
+        rows (List[np.ndarray]): Rows to write.
+    """
+    # h5py cannot write an object array whose rows all have the same length,
+    # so such blocks are passed as a regular 2D array instead
+    if len({len(row) for row in rows}) == 1:
+        dataset[start_idx:start_idx + len(rows)] = np.stack(rows)
+    
+    else:
+        block = np.empty((len(rows),), dtype=object)
+        block[:] = rows
+        dataset[start_idx:start_idx + len(rows)] = block
+
+
+def _convert_to_vlen_dataset(
+        group: h5py.Group,
+        name: str,
+        num_rows: int,
+        block_len: int
+) -> h5py.Dataset:
+    """Replaces a fixed length 2D dataset by a vlen dataset with the same
+    number of rows and attributes.
+
+    Args:
+        group (h5py.Group): Group containing the dataset.
+        name (str): Name of the dataset.
+        num_rows (int): Number of rows already written that will be copied to
+            the new dataset.
+        block_len (int): Number of rows copied per read/write.
+
+    Returns:
+        h5py.Dataset: The new vlen dataset.
+    """
+    fixed_dataset = group[name]
+    tmp_name = f"{name}__fixed"
+    group.move(name, tmp_name)
+
+    dataset = group.create_dataset(
+        name=name,
+        shape=(fixed_dataset.shape[0],),
+        dtype=h5py.vlen_dtype(fixed_dataset.dtype),
+        chunks=(max(1, min(_VLEN_WRITE_BLOCK_LEN, fixed_dataset.shape[0])),)
+    )
+    dataset.attrs.update(fixed_dataset.attrs)
+
+    for start_idx in range(0, num_rows, block_len):
+        end_idx = min(start_idx + block_len, num_rows)
+        dataset[start_idx:end_idx] = fixed_dataset[start_idx:end_idx]
+
+    del group[tmp_name]
+    return dataset
 
 
 def _as_audiodtype(
@@ -21,7 +274,9 @@ def _as_audiodtype(
         data_end_idx: int,
         dtype: np.dtype,
         parser_name: str,
-        ctx: dict = {}
+        ctx: dict = {},
+        num_samples_column: Optional[str] = None,
+        sample_rate_column: Optional[str] = None
 ) -> None:
     """Parses audio file paths to extract audio data that will be written to
     a `.h5`file.
@@ -39,74 +294,197 @@ def _as_audiodtype(
         dtype (np.dtype): Data type used to read the audio data.
         parser_name (str): Name of parser method.
         ctx (dict): Dictionary containing context variables.
-        verbose (bool): Enable verbose mode if `True`.
+        num_samples_column (Optional[str]): Column with the number of samples
+            of each audio file. If provided, it is used instead of reading the
+            metadata of the files.
+        sample_rate_column (Optional[str]): Column with the sample rate of
+            each audio file. If provided, it is used instead of reading the
+            metadata of the files.
     """
+    # Data type object is built once and shared by all dataset operations
+    dtype = np.dtype(dtype)
+
     # NOTE: Files are already validated at this point
-    files = data_frame[data_column_name].to_list()[data_start_idx:data_end_idx]
+    files = _slice_column(
+        data_frame,
+        data_column_name,
+        data_start_idx,
+        data_end_idx
+    )
     
     # Prepend root from context if path is relative
-    files = [
-        f if os.path.isabs(f) else os.path.join(ctx["root_dir"], f)
-        for f in files
-    ]
-
-    # Check if files are fixed length or vlen
-    observed_lens = []
-    vlen = False
-
-    for idx, file in enumerate(files):
-        # Get number of samples
-        num_samples = read_audio_metadata(file)["num_samples_per_channel"]
-
-        if num_samples not in observed_lens:
-            observed_lens.append(num_samples)
-        
-        if len(observed_lens) > 1:
-            vlen = True
-            break
+    files = resolve_paths(files, ctx["root_dir"])
+
+    if num_samples_column is not None:
+        # Lengths are already known from the data frame
+        lens = _slice_column(
+            data_frame,
+            num_samples_column,
+            data_start_idx,
+            data_end_idx
+        ).to_numpy()
+        num_samples = int(lens[0])
+        vlen = bool(lens.max() != lens.min())
+        meta = None
+
+    else:
+        # Files are assumed to be fixed length from the first one only. The
+        # dataset is converted to vlen as soon as a decoded file differs
+        meta = read_audio_metadata_cached(files[0])
+        num_samples = meta["num_samples_per_channel"]
+        vlen = False
     
     # NOTE: All audios have the same sample rate
-    fs = read_audio_metadata(files[0])["fs"]
+    if sample_rate_column is not None:
+        fs = int(data_frame[sample_rate_column][data_start_idx])
+
+    elif meta is not None:
+        fs = meta["fs"]
+
+    else:
+        fs = read_audio_metadata_cached(files[0])["fs"]
 
     # Add group data
     if not vlen:
+        # Each chunk holds whole rows to match the row-wise read pattern
+        row_nbytes = max(1, num_samples * dtype.itemsize)
+        chunk_len = max(
+            1,
+            min(_MAX_CHUNK_LEN, len(files), _MAX_CHUNK_NBYTES // row_nbytes)
+        )
         dataset = partition_data_group.create_dataset(
             name=partition_field_name,
             shape=(len(files), num_samples),
-            dtype=dtype
+            dtype=dtype,
+            chunks=(chunk_len, num_samples) if num_samples > 0 else None,
+            **_get_compression_kwargs(ctx) if num_samples > 0 else {}
         )
     
     else:
         dataset = partition_data_group.create_dataset(
             name=partition_field_name,
             shape=(len(files),),
-            dtype=h5py.vlen_dtype(np.dtype(dtype))
+            dtype=h5py.vlen_dtype(dtype),
+            chunks=(max(1, min(_VLEN_WRITE_BLOCK_LEN, len(files))),)
         )
     
     # Add auxiliary meta data for audio filemeta data for audio files
     dataset.attrs["parser"] = parser_name
     dataset.attrs["sample_rate"] = str(fs)
 
+    # Store filenames only, as fixed length strings that are written and read
+    # as a single contiguous buffer
+    filenames = [os.path.basename(file).encode("utf-8") for file in files]
+    filenames_dtype = h5py.string_dtype(
+        encoding="utf-8",
+        length=max(1, max(len(f) for f in filenames))
+    )
     filenames_dataset = partition_data_group.create_dataset(
         name=f"{partition_field_name}__filepath",
         shape=(len(files),),
-        dtype=h5py.string_dtype()
+        dtype=filenames_dtype
     )
+    filenames_dataset.write_direct(np.array(filenames, dtype=filenames_dtype))
 
-    for idx, file in enumerate(files):
-        data, _ = read_audio(file, dtype=dtype)
+    # Files are decoded concurrently and each block of rows is written with a
+    # single call instead of one call per row
+    if vlen:
+        block_len = _VLEN_WRITE_BLOCK_LEN
 
-        if vlen:
-            dataset[idx] = data
-        
-        else:
-            dataset[idx, :] = data
+    else:
+        # Blocks span whole chunks so no chunk is written twice
+        block_len = max(
+            chunk_len,
+            _WRITE_BLOCK_NBYTES // row_nbytes // chunk_len * chunk_len
+        )
+
+    read_fn = partial(_read_audio_data, dtype=dtype)
+
+    # Chunks are only filtered by hand if the dataset has no other filters
+    # than shuffle and gzip, using the same settings as the dataset
+    direct_gzip = (
+        not vlen
+        and dataset.compression == "gzip"
+        and not dataset.fletcher32
+        and dataset.scaleoffset is None
+    )
+    gzip_shuffle = dataset.shuffle
+    gzip_level = dataset.compression_opts
+
+    # Fixed length rows are decoded into a single reusable buffer
+    buffer = (
+        None if vlen
+        else np.empty((min(block_len, len(files)), num_samples), dtype=dtype)
+    )
 
-        # Store filename only
-        filenames_dataset[idx] = os.path.basename(file)
-        
-        # Update progress bar
-        ctx["queue"].put((partition_idx, 1))
+    with ThreadPoolExecutor(
+        max_workers=min(len(files), _MAX_DECODE_THREADS)
+    ) as executor:
+        for start_idx in range(0, len(files), block_len):
+            block_files = files[start_idx:start_idx + block_len]
+
+            if vlen:
+                block = [None] * len(block_files)
+
+            else:
+                block = buffer[:len(block_files)]
+
+            # Fixed length files are decoded straight into their buffer row
+            decoded = (
+                executor.map(read_fn, block_files) if vlen
+                else executor.map(_read_audio_row, block_files, block)
+            )
+
+            for idx, data in enumerate(decoded):
+                # Rows decoded into the buffer are already in place
+                if data is not None:
+                    if not vlen and len(data) != num_samples:
+                        # File with a different length than the first one
+                        vlen = True
+                        dataset = _convert_to_vlen_dataset(
+                            group=partition_data_group,
+                            name=partition_field_name,
+                            num_rows=start_idx,
+                            block_len=block_len
+                        )
+                        block = list(block)
+
+                    block[idx] = data
+
+                # Update progress bar
+                if (idx + 1) % _PROGRESS_STEP == 0:
+                    ctx["queue"].put((partition_idx, _PROGRESS_STEP))
+
+            if len(block_files) % _PROGRESS_STEP > 0:
+                ctx["queue"].put(
+                    (partition_idx, len(block_files) % _PROGRESS_STEP)
+                )
+
+            if vlen:
+                _write_vlen_rows(dataset, start_idx, block)
+
+            elif block.size > 0 and direct_gzip:
+                # zlib releases the GIL, so chunks are compressed by the
+                # decoding threads instead of by HDF5 while writing
+                chunk_starts = range(0, len(block), chunk_len)
+                chunks = executor.map(
+                    lambda idx: _deflate_chunk(
+                        block[idx:idx + chunk_len],
+                        chunk_len,
+                        shuffle=gzip_shuffle,
+                        level=gzip_level
+                    ),
+                    chunk_starts
+                )
+
+                for idx, chunk in zip(chunk_starts, chunks):
+                    dataset.id.write_direct_chunk((start_idx + idx, 0), chunk)
+
+            elif block.size > 0:
+                dataset.write_direct(
+                    block,
+                    dest_sel=np.s_[start_idx:start_idx + len(block_files)]
+                )
 
 
 def as_audioint16(
@@ -117,7 +495,9 @@ def as_audioint16(
         data_column_name: str,
         data_start_idx: int,
         data_end_idx: int,
-        ctx: dict = {}
+        ctx: dict = {},
+        num_samples_column: Optional[str] = None,
+        sample_rate_column: Optional[str] = None
 ) -> None:
     """Alias of generic parser for audio data as `int16`."""
     return _as_audiodtype(
@@ -130,7 +510,9 @@ def as_audioint16(
         data_end_idx=data_end_idx,
         dtype=np.int16,
         parser_name="as_audioint16",
-        ctx=ctx
+        ctx=ctx,
+        num_samples_column=num_samples_column,
+        sample_rate_column=sample_rate_column
     )
 
 
@@ -142,7 +524,9 @@ def as_audiofloat32(
         data_column_name: str,
         data_start_idx: int,
         data_end_idx: int,
-        ctx: dict = {}
+        ctx: dict = {},
+        num_samples_column: Optional[str] = None,
+        sample_rate_column: Optional[str] = None
 ) -> None:
     """Alias of generic parser for audio data as `float32`."""
     return _as_audiodtype(
@@ -155,7 +539,9 @@ def as_audiofloat32(
         data_end_idx=data_end_idx,
         dtype=np.float32,
         parser_name="as_audiofloat32",
-        ctx=ctx
+        ctx=ctx,
+        num_samples_column=num_samples_column,
+        sample_rate_column=sample_rate_column
     )
 
     
@@ -168,7 +554,9 @@ def as_audiofloat64(
         data_start_idx: int,
         data_end_idx: int,
         ctx: dict = {},
-) -> List[np.ndarray]:
+        num_samples_column: Optional[str] = None,
+        sample_rate_column: Optional[str] = None
+) -> None:
     """Alias of generic parser for audio data as `float64`."""
     return _as_audiodtype(
         partition_idx=partition_idx,
@@ -180,7 +568,9 @@ def as_audiofloat64(
         data_end_idx=data_end_idx,
         dtype=np.float64,
         parser_name="as_audiofloat64",
-        ctx=ctx
+        ctx=ctx,
+        num_samples_column=num_samples_column,
+        sample_rate_column=sample_rate_column
     )
 
 
@@ -213,10 +603,42 @@ def _as_dtype(
         parser_name (str): Name of parser method.
         ctx (dict): Dictionary containing context variables.
     """
-    metrics = (
-        data_frame[data_column_name].to_list()[data_start_idx:data_end_idx]
+    dtype = np.dtype(dtype)
+    metrics = _slice_column(
+        data_frame,
+        data_column_name,
+        data_start_idx,
+        data_end_idx
     )
 
+    # Values are converted all at once, so missing and out of range values
+    # are checked beforehand instead of failing on their own write
+    if metrics.null_count() > 0:
+        raise ValueError(f"Column '{data_column_name}' has missing values")
+
+    # NOTE: Polars cannot convert Int128 to NumPy, so values are converted to
+    # Int64 for integer types (out of range values would not fit anyway) or to
+    # Float64 for floating point types first
+    if metrics.dtype == pl.Int128:
+        if not np.issubdtype(dtype, np.integer):
+            metrics = metrics.cast(pl.Float64)
+
+        elif len(metrics) > 0 and (
+            metrics.min() < np.iinfo(np.int64).min
+            or metrics.max() > np.iinfo(np.int64).max
+        ):
+            raise OverflowError(
+                f"Column '{data_column_name}' has values out of the range of "
+                f"{dtype.name}"
+            )
+
+        else:
+            metrics = metrics.cast(pl.Int64)
+
+    metrics = metrics.to_numpy()
+
+    _check_int_range(metrics, dtype, data_column_name)
+
     # Add group data
     dataset = partition_data_group.create_dataset(
         name=partition_field_name,
@@ -225,9 +647,14 @@ def _as_dtype(
     )
     dataset.attrs["parser"] = parser_name
 
-    for idx, metric in enumerate(metrics):
-        dataset[idx] = metric
-        ctx["queue"].put((partition_idx, 1))
+    # Store data in a single write
+    if len(metrics) > 0:
+        dataset.write_direct(
+            np.ascontiguousarray(metrics.astype(dtype, copy=False))
+        )
+
+    # Update progress bar
+    ctx["queue"].put((partition_idx, len(metrics)))
 
 
 def as_int8(
@@ -341,9 +768,12 @@ def as_utf8str(
     ctx: dict = {}
 ) -> None:
     """Alias of generic parser for single value data as `str`."""
-    values = (
-        data_frame[data_column_name].to_list()[data_start_idx:data_end_idx]
-    )
+    values = _slice_column(
+        data_frame,
+        data_column_name,
+        data_start_idx,
+        data_end_idx
+    ).to_numpy()
 
     # Add group data
     dataset = partition_data_group.create_dataset(
@@ -353,12 +783,11 @@ def as_utf8str(
     )
     dataset.attrs["parser"] = "as_utf8str"
 
-    for idx, value in enumerate(values):
-        # Store data
-        dataset[idx] = value
+    # Store data in a single write
+    dataset[:] = values.astype(object, copy=False)
 
-        # Update progress bar
-        ctx["queue"].put((partition_idx, 1))
+    # Update progress bar
+    ctx["queue"].put((partition_idx, len(values)))
 
 
 def _as_listdtype(
@@ -390,45 +819,64 @@ def _as_listdtype(
         parser_name (str): Name of parser method.
         ctx (dict): Dictionary containing context variables.
     """
+    dtype = np.dtype(dtype)
+
     # Get lists as str
-    lists = (
-        data_frame[data_column_name].to_list()[data_start_idx:data_end_idx]
+    flat_values, lens = _parse_lists(
+        _slice_column(
+            data_frame,
+            data_column_name,
+            data_start_idx,
+            data_end_idx
+        )
     )
 
-    # Transform list to dtype
-    lists = [ast.literal_eval(li) for li in lists]
+    # Lists are parsed as floats, so values are checked before being cast to
+    # integers to avoid wrapping or truncating them
+    if np.issubdtype(dtype, np.integer):
+        _check_int_range(flat_values, dtype, data_column_name)
 
-    # Check if lists have same length
-    vlen = not are_lists_equal_len(*lists)
+        if not np.all(np.mod(flat_values, 1) == 0):
+            raise ValueError(
+                f"Column '{data_column_name}' has non integer values"
+            )
 
     # Transform lists to target data type
-    lists = [np.array(li, dtype=dtype) for li in lists]
+    flat_values = flat_values.astype(dtype)
+
+    # Check if lists have same length (empty partitions are stored as vlen)
+    vlen = len(lens) == 0 or bool(lens.min() != lens.max())
     
     # Add group data
     if vlen:
         dataset = partition_data_group.create_dataset(
             name=partition_field_name,
-            shape=(len(lists),),
-            dtype=h5py.vlen_dtype(np.dtype(dtype))
+            shape=(len(lens),),
+            dtype=h5py.vlen_dtype(dtype)
         )
     
     else:
         dataset = partition_data_group.create_dataset(
             name=partition_field_name,
-            shape=(len(lists), len(lists[0])),
+            shape=(len(lens), lens[0]),
             dtype=dtype
         )
 
     dataset.attrs["parser"] = parser_name
 
-    for idx, data in enumerate(lists):
-        if vlen:
-            dataset[idx] = data
+    # Store data in a single write
+    if vlen and len(lens) > 0:
+        _write_vlen_rows(
+            dataset,
+            0,
+            np.split(flat_values, np.cumsum(lens)[:-1])
+        )
 
-        else:
-            dataset[idx, :] = data
-        
-        ctx["queue"].put((partition_idx, 1))
+    elif not vlen and flat_values.size > 0:
+        dataset.write_direct(flat_values.reshape(len(lens), lens[0]))
+
+    # Update progress bar
+    ctx["queue"].put((partition_idx, len(lens)))
 
 
 def as_listint8(
@@ -1,18 +1,46 @@
 import os
 import yaml
 import polars as pl
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    List,
+    Optional
+)
 from ..core.config import get_allowed_audio_extensions
 from ..core.display import exit_error
 from ..core.guards import (
     has_ext,
     is_file_with_ext_or_error
 )
-from ..core.io import read_audio_metadata
+from ..core.io import (
+    read_audio_metadata_cached,
+    resolve_paths
+)
 from ..core.exceptions import (
     ChannelCountError,
     SampleRateError
 )
 
+# Reading audio headers is mostly waiting on storage, so files are read by
+# several threads, one block of files at a time
+_MAX_METADATA_THREADS = min(16, 2 * (os.cpu_count() or 1))
+_METADATA_BLOCK_LEN = 1024
+_PROBE_LEN = 16
+
+# Columns of the audio metadata cache file
+_METADATA_CACHE_SCHEMA = {
+    "file": pl.String,
+    "mtime_ns": pl.Int64,
+    "size": pl.Int64,
+    "fs": pl.Int64,
+    "num_channels": pl.Int64,
+    "num_samples_per_channel": pl.Int64
+}
+
+# libyaml based loader, if PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def validate_config_file(file: str, ctx: dict) -> dict:
     """Validate configuration file in `.yaml format.
@@ -26,8 +54,9 @@ def validate_config_file(file: str, ctx: dict) -> dict:
     """
     # Open .yaml file
     try:
-        with open(file, "r") as f:
-            specs = yaml.safe_load(f)
+        # File is read at once as bytes and decoded by the YAML loader
+        with open(file, "rb") as f:
+            specs = yaml.load(f.read(), Loader=_YAML_LOADER)
     
     except Exception as e:
         exit_error(f"Configuration file could not be parsed: {e}")
@@ -40,42 +69,52 @@ def validate_config_file(file: str, ctx: dict) -> dict:
     datasets = specs["datasets"]
 
     for dataset_name, dataset_config in datasets.items():
-        # Validate attrs if any (attrs are optional)
-        for attr_name, attr_value in dataset_config.get("attrs", {}).items():
-            if not isinstance(attr_value, str):
-                exit_error(
-                    "Attributes can only be of type str. Found key "
-                    f"'{attr_name}' of 'attrs' of dataset '{dataset_name}'"
-                    f" of type '{attr_value.__class__.__name__}'"
-                )
+        # Validate attrs if any (attrs are optional). YAML strings are always
+        # plain `str`, so an exact type check is enough
+        invalid_attr = next(
+            (
+                (k, v) for k, v in dataset_config.get("attrs", {}).items()
+                if type(v) is not str
+            ),
+            None
+        )
+
+        if invalid_attr is not None:
+            attr_name, attr_value = invalid_attr
+            exit_error(
+                "Attributes can only be of type str. Found key "
+                f"'{attr_name}' of 'attrs' of dataset '{dataset_name}'"
+                f" of type '{attr_value.__class__.__name__}'"
+            )
         
         if "data" not in dataset_config:
             exit_error(f"Missing 'data' key in dataset '{dataset_name}'")
 
-        if "file" not in dataset_config["data"]:
+        data_config = dataset_config["data"]
+
+        if "file" not in data_config:
             exit_error(f"Missing 'file' key in dataset '{dataset_name}'")
         
         # Use context root dir to validate data file
-        data_file = os.path.join(
-            ctx["root_dir"],
-            dataset_config["data"]["file"]
-        )
+        data_file = os.path.join(ctx["root_dir"], data_config["file"])
 
         # NOTE: Only the extension is validated since existance of file should
         # be validated at runtime
-        if not has_ext(data_file, ext=".csv"):
+        if not has_ext(data_file, ext=[".csv", ".parquet"]):
             exit_error(
                 f"Invalid data file '{data_file}' in dataset "
                 f"'{dataset_name}'"
             )
         
-        if "fields" not in dataset_config["data"]:
+        if "fields" not in data_config:
             exit_error(f"Missing 'fields' key in dataset '{dataset_name}'")
         
-        if len(dataset_config["data"]["fields"]) == 0:
+        fields = data_config["fields"]
+
+        if len(fields) == 0:
             exit_error(f"0 fields found in dataset '{dataset_name}'")
         
-        for field_name, field_data in dataset_config["data"]["fields"].items():
+        for field_name, field_data in fields.items():
             if "column" not in field_data:
                 exit_error(
                     f"Missing 'column' key for field '{field_name}' in "
@@ -91,10 +130,127 @@ def validate_config_file(file: str, ctx: dict) -> dict:
     return specs
 
 
+def _load_metadata_cache(file: str) -> dict:
+    """Loads the audio metadata cached by previous validations.
+
+    Args:
+        file (str): `.parquet` cache file. It may not exist yet.
+
+    Returns:
+        dict: Cached metadata of each audio file.
+    """
+    if not os.path.isfile(file):
+        return {}
+    
+    return {
+        row["file"]: row
+        for row in pl.read_parquet(file).iter_rows(named=True)
+    }
+
+
+def _save_metadata_cache(file: str, cache: dict) -> None:
+    """Saves the audio metadata cache.
+
+    Args:
+        file (str): `.parquet` cache file.
+        cache (dict): Cached metadata of each audio file.
+    """
+    pl.DataFrame(
+        list(cache.values()),
+        schema=_METADATA_CACHE_SCHEMA
+    ).write_parquet(file)
+
+
+def _read_audio_file_metadata(
+        file: str,
+        ext: List[str],
+        cache: Optional[dict] = None
+) -> dict:
+    """Checks an audio file exists and reads its metadata.
+
+    Args:
+        file (str): Audio file.
+        ext (List[str]): Allowed audio file extensions.
+        cache (Optional[dict]): Metadata cached by previous validations. It is
+            used if the file did not change since it was cached, and updated
+            otherwise.
+
+    Returns:
+        dict: Metadata of the audio file.
+    """
+    is_file_with_ext_or_error(file, ext=ext)
+
+    if cache is None:
+        return read_audio_metadata_cached(file)
+    
+    # Files are assumed unchanged if their size and modification time match
+    stat = os.stat(file)
+    meta = cache.get(file)
+
+    if (
+        meta is None
+        or meta["mtime_ns"] != stat.st_mtime_ns
+        or meta["size"] != stat.st_size
+    ):
+        meta = {
+            "file": file,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            **{
+                k: v for k, v in read_audio_metadata_cached(file).items()
+                if k in _METADATA_CACHE_SCHEMA
+            }
+        }
+        cache[file] = meta
+
+    return meta
+
+
+def _check_audio_file_metadata(
+        idx: int,
+        file: str,
+        meta: dict,
+        expected_meta: dict,
+        expected_fs: int
+) -> None:
+    """Checks the metadata of a single audio file.
+
+    Args:
+        idx (int): Row index of the file.
+        file (str): Audio file.
+        meta (dict): Metadata of the audio file.
+        expected_meta (dict): Metadata columns given as ``(column, values)``
+            by metadata key.
+        expected_fs (int): Sample rate expected from all files.
+    """
+    if meta["num_channels"] != 1:
+        raise ChannelCountError(
+            "Currently only mono files are supported but "
+            f"'{file}' has {meta['num_channels']} channels"
+        )
+
+    # Metadata columns must match the files since parsers trust them
+    for meta_key, (meta_col, values) in expected_meta.items():
+        if values[idx] != meta[meta_key]:
+            raise ValueError(
+                f"Column '{meta_col}' has value {values[idx]} but "
+                f"file '{file}' has {meta[meta_key]}"
+            )
+
+    if meta["fs"] != expected_fs:
+        raise SampleRateError(
+            "All files should have the same sample rate. Previous "
+            f"files had sample rate {expected_fs} but current "
+            f"file '{file}' has sample rate {meta['fs']}"
+        )
+
+
 def _validate_file_as_audiodtype(
         df: pl.DataFrame,
         col: str,
-        ctx: dict
+        ctx: dict,
+        num_samples_column: Optional[str] = None,
+        sample_rate_column: Optional[str] = None
 ) -> None:
     """Generic validator of audio types.
     
@@ -103,80 +259,155 @@ def _validate_file_as_audiodtype(
             audio file paths.
         col (str): Column name.
         ctx (dict): Validation context.
+        num_samples_column (Optional[str]): Column with the number of samples
+            of each audio file.
+        sample_rate_column (Optional[str]): Column with the sample rate of each
+            audio file.
     """
+    # Check optional metadata columns exist
+    expected_meta = {}
+
+    for meta_key, meta_col in (
+        ("num_samples_per_channel", num_samples_column),
+        ("fs", sample_rate_column)
+    ):
+        if meta_col is not None:
+            if meta_col not in df.columns:
+                raise ValueError(f"Column '{meta_col}' not found")
+
+            expected_meta[meta_key] = (meta_col, df[meta_col].to_numpy())
+
     # Get all files
-    files = df[col].to_list()
-    observed_fs = []
+    files = df[col]
+    expected_fs = None
     progress_bar = ctx["progress_bar"]
 
-    with progress_bar:
+    # Optional metadata cache shared between runs
+    cache_file = ctx.get("metadata_cache")
+    cache = _load_metadata_cache(cache_file) if cache_file else None
+
+    # Metadata is read concurrently, but checked in order in this thread so
+    # the first invalid file after the probe is always the one reported
+    read_fn = partial(
+        _read_audio_file_metadata,
+        ext=get_allowed_audio_extensions(),
+        cache=cache
+    )
+
+    with progress_bar, ThreadPoolExecutor(
+        max_workers=max(1, min(len(files), _MAX_METADATA_THREADS))
+    ) as executor:
         # Add task
         task = progress_bar.add_task(f"Validating '{col}'", total=len(files))
 
-        for file in files:
-            # Make step
-            progress_bar.advance(task)
-            
-            # Solve path
-            file = (
-                os.path.join(ctx["root_dir"], file) if not os.path.isabs(file)
-                else file
+        # A few files spread across the column are checked first, so that
+        # wrong configurations or formats fail before the full pass
+        probe_idx = list(
+            range(0, len(files), max(1, len(files) // _PROBE_LEN))
+        )[:_PROBE_LEN]
+        probe_files = resolve_paths(files.gather(probe_idx), ctx["root_dir"])
+
+        for idx, file, meta in zip(
+            probe_idx,
+            probe_files,
+            executor.map(read_fn, probe_files)
+        ):
+            # First file sets the sample rate expected from all others
+            if expected_fs is None:
+                expected_fs = meta["fs"]
+
+            _check_audio_file_metadata(
+                idx,
+                file,
+                meta,
+                expected_meta=expected_meta,
+                expected_fs=expected_fs
             )
 
-            is_file_with_ext_or_error(file, ext=get_allowed_audio_extensions())
-            meta = read_audio_metadata(file)
+        # Files are taken from the column one block at a time
+        for start_idx in range(0, len(files), _METADATA_BLOCK_LEN):
+            # Solve paths
+            block_files = resolve_paths(
+                files.slice(start_idx, _METADATA_BLOCK_LEN),
+                ctx["root_dir"]
+            )
 
-            if meta["num_channels"] != 1:
-                raise ChannelCountError(
-                    f"Currently only mono files are supported but '{file}' has"
-                    f" {meta['num_channels']} channels"
-                )
+            # Files repeated in the block are only read once. Unique files
+            # are kept in order of first appearance, so each new file is the
+            # next one read
+            unique_files = list(dict.fromkeys(block_files))
+            unique_metas = zip(
+                unique_files,
+                executor.map(read_fn, unique_files)
+            )
+            block_metas = {}
 
-            if meta["fs"] not in observed_fs:
-                observed_fs.append(meta["fs"])
+            for idx, file in enumerate(block_files, start=start_idx):
+                if file not in block_metas:
+                    block_metas[file] = next(unique_metas)[1]
 
-            if len(observed_fs) > 1:
-                raise SampleRateError(
-                    "All files should have the same sample rate. Previous "
-                    f"files had sample rate {observed_fs[0]} but current file "
-                    f"'{file}' has sample rate {observed_fs[-1]}"
+                meta = block_metas[file]
+                _check_audio_file_metadata(
+                    idx,
+                    file,
+                    meta,
+                    expected_meta=expected_meta,
+                    expected_fs=expected_fs
                 )
+            
+            # Make step (once per block)
+            progress_bar.advance(task, advance=len(block_files))
+
+    if cache is not None:
+        _save_metadata_cache(cache_file, cache)
 
 
 def validate_file_as_audioint16(
         df: pl.DataFrame,
         col: str,
         ctx: dict,
+        num_samples_column: Optional[str] = None,
+        sample_rate_column: Optional[str] = None
 ) -> None:
     """Alias of generic method to validate audio as `int16`."""
     return _validate_file_as_audiodtype(
         df=df,
         col=col,
-        ctx=ctx
+        ctx=ctx,
+        num_samples_column=num_samples_column,
+        sample_rate_column=sample_rate_column
     )
 
 
 def validate_file_as_audiofloat32(
         df: pl.DataFrame,
         col: str,
-        ctx: dict
+        ctx: dict,
+        num_samples_column: Optional[str] = None,
+        sample_rate_column: Optional[str] = None
 ) -> None:
     """Alias of generic method to validate audio as `float32`."""
     return _validate_file_as_audiodtype(
         df=df,
         col=col,
-        ctx=ctx
+        ctx=ctx,
+        num_samples_column=num_samples_column,
+        sample_rate_column=sample_rate_column
     )
 
 
 def validate_file_as_audiofloat64(
         df: pl.DataFrame,
         col:str,
-        ctx: dict
+        ctx: dict,
+        num_samples_column: Optional[str] = None,
+        sample_rate_column: Optional[str] = None
 ) -> None:
     """Alias of generic method to validate audio as `float64`."""
     return _validate_file_as_audiodtype(
         df=df,
         col=col,
-        ctx=ctx
+        ctx=ctx,
+        num_samples_column=num_samples_column,
+        sample_rate_column=sample_rate_column
     )
@@ -0,0 +1,104 @@
+import struct
+import pytest
+import numpy as np
+import soundfile as sf
+from h5pack.core.io import (
+    _read_wav_into,
+    get_dir_files,
+    read_audio_into
+)
+
+
+def insert_chunks_before_data(file: str, chunks: list) -> None:
+    """Inserts extra RIFF chunks before the `data` chunk of a `.wav` file."""
+    with open(file, "rb") as f:
+        wav = f.read()
+
+    data_idx = wav.index(b"data")
+    extra = b"".join(
+        struct.pack("<4sI", chunk_id, len(chunk_data))
+        + chunk_data
+        + b"\x00" * (len(chunk_data) % 2)
+        for chunk_id, chunk_data in chunks
+    )
+    wav = wav[:data_idx] + extra + wav[data_idx:]
+
+    with open(file, "wb") as f:
+        f.write(wav[:4] + struct.pack("<I", len(wav) - 8) + wav[8:])
+
+
+@pytest.mark.parametrize("fmt", ["WAV", "WAVEX"])
+@pytest.mark.parametrize(
+    "subtype, dtype, is_raw",
+    [
+        ("PCM_16", "int16", True),
+        ("FLOAT", "float32", True),
+        ("DOUBLE", "float64", True),
+        ("PCM_24", "int16", False),
+        ("PCM_16", "float32", False),
+        ("FLOAT", "int16", False)
+    ]
+)
+@pytest.mark.parametrize("extra_chunks", [False, True])
+def test_read_audio_into_matches_soundfile(
+        tmp_path,
+        fmt,
+        subtype,
+        dtype,
+        is_raw,
+        extra_chunks
+):
+    file = str(tmp_path / "test.wav")
+    sf.write(
+        file,
+        np.sin(np.arange(101) * 0.05) * 0.5,
+        16000,
+        subtype=subtype,
+        format=fmt
+    )
+
+    # Odd sized chunk checks the padding byte is skipped
+    if extra_chunks:
+        insert_chunks_before_data(
+            file,
+            [(b"LIST", b"INFOISFT\x04\x00\x00\x00h5p\x00"), (b"junk", b"abc")]
+        )
+
+    expected, _ = sf.read(file, dtype=dtype)
+    out = np.empty(len(expected), dtype=dtype)
+
+    assert _read_wav_into(file, out) == is_raw
+    assert read_audio_into(file, out)
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_read_audio_into_rejects_different_length(tmp_path):
+    file = str(tmp_path / "test.wav")
+    sf.write(file, np.zeros(100, dtype="float32"), 16000, subtype="FLOAT")
+
+    assert not read_audio_into(file, np.empty(99, dtype="float32"))
+
+
+def test_read_audio_into_rejects_multichannel(tmp_path):
+    file = str(tmp_path / "test.wav")
+    sf.write(file, np.zeros((50, 2), dtype="int16"), 16000, subtype="PCM_16")
+
+    assert not read_audio_into(file, np.empty(100, dtype="int16"))
+
+
+def test_get_dir_files_without_folders():
+    assert get_dir_files([]) == []
+
+
+def test_get_dir_files_searches_folders(tmp_path):
+    for file in ("a.wav", "b.txt", "sub/c.wav", ".hidden/d.wav"):
+        (tmp_path / file).parent.mkdir(exist_ok=True)
+        (tmp_path / file).touch()
+
+    assert get_dir_files(str(tmp_path)) == [
+        str(tmp_path / "a.wav"),
+        str(tmp_path / "sub" / "c.wav")
+    ]
+    assert get_dir_files(str(tmp_path), recursive=False) == [
+        str(tmp_path / "a.wav")
+    ]
@@ -0,0 +1,79 @@
+import sys
+import h5py
+import subprocess
+import numpy as np
+import soundfile as sf
+
+
+def run_h5pack(*args: str, cwd: str) -> subprocess.CompletedProcess:
+    """Runs the `h5pack` command line tool in a separate process."""
+    return subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from h5pack.cli.main import main; sys.exit(main())",
+            *args
+        ],
+        cwd=cwd,
+        capture_output=True,
+        text=True
+    )
+
+
+def test_pack_more_partitions_than_pool_batches(tmp_path):
+    # At least 8 partitions per worker, so each pool task gets a batch of
+    # several partitions
+    num_files = 99
+    num_workers = 4
+    rows = ["file,label"]
+
+    for idx in range(num_files):
+        sf.write(
+            tmp_path / f"{idx}.wav",
+            np.full(16, idx / num_files, dtype="float32"),
+            16000,
+            subtype="FLOAT"
+        )
+        rows.append(f"{idx}.wav,{idx}")
+
+    (tmp_path / "dataset.csv").write_text("\n".join(rows) + "\n")
+    (tmp_path / "h5pack.yaml").write_text(
+        "datasets:\n"
+        "  test:\n"
+        "    attrs: {}\n"
+        "    data:\n"
+        "      file: dataset.csv\n"
+        "      fields:\n"
+        "        audio: {column: file, parser: as_audiofloat32}\n"
+        "        label: {column: label, parser: as_int16}\n"
+    )
+
+    result = run_h5pack(
+        "pack",
+        "-d", "test",
+        "-o", "out/test.h5",
+        "-f", "3",
+        "-w", str(num_workers),
+        "--skip-checksum",
+        "-u",
+        cwd=tmp_path
+    )
+    assert result.returncode == 0, result.stderr
+
+    partitions = sorted((tmp_path / "out").glob("test.pt*.h5"))
+    assert len(partitions) == num_files // 3
+
+    labels = []
+    audio = []
+
+    for partition in partitions:
+        with h5py.File(partition) as f:
+            labels.append(f["data/label"][()])
+            audio.append(f["data/audio"][:, 0])
+
+    np.testing.assert_array_equal(np.concatenate(labels), np.arange(num_files))
+    np.testing.assert_allclose(
+        np.concatenate(audio),
+        np.arange(num_files) / num_files,
+        rtol=1e-6
+    )
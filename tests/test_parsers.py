@@ -0,0 +1,131 @@
+import h5py
+import pytest
+import numpy as np
+import polars as pl
+import soundfile as sf
+from queue import Queue
+from h5pack.data.parsers import (
+    _deflate_chunk,
+    as_audioint16,
+    as_float64,
+    as_int16,
+    as_listint8,
+    as_listint16
+)
+
+
+def parse_column(parser, values: list, ctx: dict = {}) -> np.ndarray:
+    """Parses a single column `DataFrame` into an in-memory `.h5` file."""
+    df = pl.DataFrame({"col": values})
+
+    with h5py.File("test.h5", "w", driver="core", backing_store=False) as f:
+        parser(
+            partition_idx=0,
+            partition_data_group=f,
+            partition_field_name="field",
+            data_frame=df,
+            data_column_name="col",
+            data_start_idx=0,
+            data_end_idx=len(df),
+            ctx={"queue": Queue(), **ctx}
+        )
+
+        return f["field"][()]
+
+
+def test_as_listint_parses_lists():
+    np.testing.assert_array_equal(
+        parse_column(as_listint8, ["[1, -2]", "[127, -128]"]),
+        [[1, -2], [127, -128]]
+    )
+
+
+@pytest.mark.parametrize(
+    "parser, values",
+    [
+        (as_listint8, ["[200, 1]"]),
+        (as_listint8, ["[1, -129]"]),
+        (as_listint16, ["[40000]"])
+    ]
+)
+def test_as_listint_rejects_out_of_range_values(parser, values):
+    with pytest.raises(OverflowError):
+        parse_column(parser, values)
+
+
+@pytest.mark.parametrize("parser", [as_listint8, as_listint16])
+def test_as_listint_rejects_non_integer_values(parser):
+    with pytest.raises(ValueError):
+        parse_column(parser, ["[1.5]"])
+
+
+def test_as_int_parses_int128_column():
+    values = pl.Series([1, -2, 3], dtype=pl.Int128)
+    np.testing.assert_array_equal(parse_column(as_int16, values), [1, -2, 3])
+    np.testing.assert_array_equal(
+        parse_column(as_float64, values),
+        [1.0, -2.0, 3.0]
+    )
+
+
+def test_as_int_rejects_out_of_range_int128_column():
+    with pytest.raises(OverflowError):
+        parse_column(as_int16, pl.Series([1, 2**70], dtype=pl.Int128))
+
+
+def test_as_float_parses_large_int128_column():
+    np.testing.assert_array_equal(
+        parse_column(as_float64, pl.Series([1, 2**70], dtype=pl.Int128)),
+        [1.0, 2.0**70]
+    )
+
+
+def test_as_audio_gzip_matches_decoded_audio(tmp_path):
+    # 100 rows give a full chunk of 64 rows and a partial edge chunk
+    files = []
+
+    for idx in range(100):
+        file = tmp_path / f"{idx}.wav"
+        sf.write(
+            file,
+            np.sin(np.arange(160) * 0.01 * (idx + 1)) * 0.5,
+            16000,
+            subtype="PCM_24"
+        )
+        files.append(file.name)
+
+    data = parse_column(
+        as_audioint16,
+        files,
+        ctx={"root_dir": str(tmp_path), "compression": "gzip"}
+    )
+
+    for file, row in zip(files, data):
+        np.testing.assert_array_equal(
+            row,
+            sf.read(tmp_path / file, dtype="int16")[0]
+        )
+
+
+@pytest.mark.parametrize("shuffle", [True, False])
+def test_deflate_chunk_matches_hdf5_filters(shuffle):
+    rows = np.arange(15, dtype="int16").reshape(3, 5)
+
+    with h5py.File("test.h5", "w", driver="core", backing_store=False) as f:
+        dataset = f.create_dataset(
+            "x",
+            shape=(3, 5),
+            dtype="int16",
+            chunks=(2, 5),
+            compression="gzip",
+            compression_opts=4,
+            shuffle=shuffle
+        )
+
+        for idx in range(0, 3, 2):
+            dataset.id.write_direct_chunk(
+                (idx, 0),
+                _deflate_chunk(rows[idx:idx + 2], 2, shuffle=shuffle, level=4)
+            )
+
+        np.testing.assert_array_equal(dataset[()], rows)
@@ -0,0 +1,43 @@
+import h5py
+import numpy as np
+from h5pack.cli.utils import create_virtual_dataset_from_partitions
+
+
+def create_partition(file: str, data, dtype) -> str:
+    """Creates a partition file with a single `filepath` field."""
+    with h5py.File(file, "w") as f:
+        f.create_group("data").create_dataset(
+            "audio__filepath",
+            data=data,
+            dtype=dtype
+        )
+
+    return str(file)
+
+
+def test_virtual_mixed_fixed_and_vlen_strings(tmp_path):
+    partitions = [
+        create_partition(
+            tmp_path / "a.pt0.h5",
+            np.array([b"a.wav", b"b.wav"]),
+            "S5"
+        ),
+        create_partition(
+            tmp_path / "a.pt1.h5",
+            ["long/c.wav"],
+            h5py.string_dtype()
+        )
+    ]
+    create_virtual_dataset_from_partitions(
+        file=str(tmp_path / "a.h5"),
+        partitions=partitions,
+        force_abspath=True
+    )
+
+    with h5py.File(tmp_path / "a.h5") as f:
+        assert h5py.check_string_dtype(f["data/audio__filepath"].dtype)
+        assert f["data/audio__filepath"][()].tolist() == [
+            b"a.wav",
+            b"b.wav",
+            b"long/c.wav"
+        ]